@@ -0,0 +1,18 @@
+"""
+Ahead-of-time build for the phase 3 numeric kernels.
+
+Run `python build_kernels.py` once per environment to produce the
+`phase3_kernels` extension module; phase3.py picks it up automatically
+and skips per-run JIT compilation of the threshold sweep and summary
+kernels.
+"""
+from numba.pycc import CC
+
+from phase3 import _summarize_impl, _sweep_thresholds_impl
+
+cc = CC('phase3_kernels')
+cc.export('sweep', 'UniTuple(f8, 2)(f8[:], b1[:])')(_sweep_thresholds_impl)
+cc.export('summarize', 'UniTuple(f8, 4)(f8[:])')(_summarize_impl)
+
+if __name__ == '__main__':
+    cc.compile()